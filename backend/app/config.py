@@ -14,19 +14,29 @@ Usage:
 """
 
 import os
-from typing import Optional
+
+# Environment snapshot (read once at import; load_dotenv() runs before this module)
+_ENV = os.environ.copy()
 
 # Integration Test Mode
-INTEGRATION_TEST_MODE = os.getenv("INTEGRATION_TEST_MODE", "false").lower() == "true"
+INTEGRATION_TEST_MODE = _ENV.get("INTEGRATION_TEST_MODE", "false").lower() == "true"
+# Extra load-test users seeded alongside the integration fixtures (0 = none)
+FIXTURE_BULK_SIZE = int(_ENV.get("FIXTURE_BULK_SIZE", "0"))
 
 # Database Configuration
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./chatkit.db")
-
-# CORS Configuration
-CORS_ORIGINS = os.getenv(
-    "CORS_ORIGINS",
-    "http://localhost:3000,http://localhost:8000,http://127.0.0.1:3000,http://127.0.0.1:8000"
-).split(",")
+DATABASE_URL = _ENV.get("DATABASE_URL", "sqlite:///./chatkit.db")
+# Create missing tables on startup; set false once the schema is managed externally
+DB_AUTO_CREATE = _ENV.get("DB_AUTO_CREATE", "true").lower() == "true"
+
+# CORS Configuration (immutable; whitespace and empty entries dropped)
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in _ENV.get(
+        "CORS_ORIGINS",
+        "http://localhost:3000,http://localhost:8000,http://127.0.0.1:3000,http://127.0.0.1:8000"
+    ).split(",")
+    if origin.strip()
+)
 
 # Rate Limit Configuration
 if INTEGRATION_TEST_MODE:
@@ -44,21 +54,34 @@ else:
 
 # Email Configuration
 EMAIL_ENABLED = not INTEGRATION_TEST_MODE  # Disable email in test mode
+EMAIL_QUEUE_MAX_SIZE = 1_000  # Verification emails buffered for the background sender
 
 # Session Configuration
 SESSION_EXPIRY_HOURS = 24
 SESSION_REFRESH_THRESHOLD_MINUTES = 5
+SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS = 60  # Min gap between last_activity writes
 
 # Analytics Configuration
 ANALYTICS_ENABLED = True
+ANALYTICS_QUEUE_MAX_SIZE = 10_000          # Events buffered before new ones are dropped
+ANALYTICS_BATCH_SIZE = 500                 # Max events per INSERT batch
+ANALYTICS_FLUSH_INTERVAL_SECONDS = 0.5     # Max time an event waits before being written
+
+# Personalization Configuration
+PERSONALIZE_CHAT_HISTORY_LIMIT = 20  # Most recent saved chats fed to personalization
+
+# Maintenance Configuration
+MAINTENANCE_INTERVAL_SECONDS = 3600  # Cleanup sweep of used/expired rows
+
+# Health Check Configuration
+HEALTH_CACHE_TTL_SECONDS = 2.0  # Reuse /health DB probe result for this long
 
 # Security Configuration
-SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
+SECRET_KEY = _ENV.get("SECRET_KEY", "dev-secret-key-change-in-production")
 
 # Logging Configuration
 LOG_LEVEL = "DEBUG" if INTEGRATION_TEST_MODE else "INFO"
 
-
 def validate_required_env_vars() -> None:
     """
     Validate that required environment variables are set.
@@ -76,7 +99,7 @@ def validate_required_env_vars() -> None:
     # Production mode: Strict validation (crash early)
     if not INTEGRATION_TEST_MODE:
         # SECRET_KEY must be set and not using default value
-        if not os.getenv("SECRET_KEY"):
+        if not _ENV.get("SECRET_KEY"):
             raise ValueError(
                 "❌ FATAL: SECRET_KEY environment variable is not set in production mode.\n"
                 "   Set SECRET_KEY to a cryptographically secure random value (256-bit recommended).\n"
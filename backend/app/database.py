@@ -5,26 +5,73 @@ Using SQLite for development (easy to replace with PostgreSQL/MongoDB).
 Production deployment: update DATABASE_URL to postgres:// or mongodb://
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 import os
 
 # Database URL (SQLite for dev, Postgres for prod)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./chatkit.db")
 
+# Pool sized for FastAPI's threadpool (sync endpoints run up to 40 at once);
+# LIFO reuses the most recently returned connection so surplus ones go idle.
+# Only QueuePool takes these; in-memory SQLite uses SingletonThreadPool
+_url = make_url(DATABASE_URL)
+_pool_kwargs = {}
+if issubclass(_url.get_dialect().get_pool_class(_url), QueuePool):
+    _pool_kwargs = {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_use_lifo": True,
+    }
+
 # Create engine
+# Pre-ping drops connections the server closed while idle (e.g. Neon autosuspend)
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    **_pool_kwargs,
 )
 
+# SQLite (dev/small deploys): WAL lets readers run alongside the writer, and
+# synchronous=NORMAL fsyncs at checkpoints instead of on every commit
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
 
+# Set once tables have been created in this process
+_schema_initialized = False
+
+def init_db():
+    """
+    Create all tables (CREATE TABLE IF NOT EXISTS) once per process.
+
+    Startup and the integration fixtures both call this; only the first
+    call issues DDL. Models must be imported before calling.
+    """
+    global _schema_initialized
+    if _schema_initialized:
+        return
+    Base.metadata.create_all(bind=engine)
+    _schema_initialized = True
+
 # Dependency for FastAPI routes
 def get_db():
     """
@@ -14,10 +14,59 @@ Replaces all print() statements across the application.
 
 import json
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Tuple
+
+import orjson
+
+from app import config
+from app.middleware.request_id import request_id_ctx
+
+# Numeric severities for level gating (mirrors stdlib logging)
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# Keys never written to logs (Phase 12 security), stored lowercase for
+# case-insensitive matching
+SENSITIVE_KEYS = frozenset(
+    key.lower()
+    for key in (
+        "token",
+        "session_token",
+        "password",
+        "secret",
+        "api_key",
+        "authorization",
+        "verification_token",
+        "SECRET_KEY",
+        "DATABASE_URL",
+    )
+)
+
+# Cached "YYYY-MM-DDTHH:MM:SS" prefix for the current second (sec, prefix)
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Format the current UTC time as ISO 8601 with millisecond precision.
+
+    The second-granularity prefix is only re-formatted when the second
+    changes, so most log lines skip datetime allocation entirely.
+
+    Returns:
+        str: Timestamp like "2025-01-01T12:34:56.789Z"
+    """
+    global _timestamp_cache
 
-from app.middleware.request_id import get_request_id
+    ns = time.time_ns()
+    sec, rem = divmod(ns, 1_000_000_000)
+
+    cached_sec, prefix = _timestamp_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _timestamp_cache = (sec, prefix)
+
+    return f"{prefix}.{rem // 1_000_000:03d}Z"
 
 
 class StructuredLogger:
@@ -35,14 +84,16 @@ class StructuredLogger:
         log.debug("cache_hit", key="session_token_abc123")
     """
 
-    def __init__(self, service_name: str = "chatkit-backend"):
+    def __init__(self, service_name: str = "chatkit-backend", level: str = config.LOG_LEVEL):
         """
         Initialize structured logger.
 
         Args:
             service_name: Name of the service (for log aggregation)
+            level: Minimum level to emit (DEBUG, INFO, WARNING, ERROR)
         """
         self.service_name = service_name
+        self.min_level = LOG_LEVELS[level]
 
     def _log(
         self,
@@ -71,14 +122,14 @@ class StructuredLogger:
         """
         # Build log entry
         log_entry: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "level": level,
             "service": self.service_name,
             "event": event,
         }
 
         # Inject request ID from context (Phase 13A)
-        request_id = get_request_id()
+        request_id = request_id_ctx.get()
         if request_id:
             log_entry["request_id"] = request_id
 
@@ -88,9 +139,24 @@ class StructuredLogger:
         # Sanitize sensitive fields (Phase 12 security)
         log_entry = self._sanitize(log_entry)
 
-        # Output as JSON
-        json_output = json.dumps(log_entry, default=str)
-        print(json_output, file=sys.stdout, flush=True)
+        # Output as JSON (orjson emits UTF-8 bytes; skip print's text layer)
+        try:
+            payload = orjson.dumps(log_entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            # orjson rejects ints wider than 64 bits without consulting default=;
+            # the stdlib encoder handles them, so logging never fails a request
+            payload = (json.dumps(log_entry, default=str, separators=(",", ":")) + "\n").encode()
+        stream = sys.stdout
+        buffer = getattr(stream, "buffer", None)
+        if buffer is None:
+            # Captured or replaced stdout (StringIO, redirect_stdout) is text-only
+            stream.write(payload.decode())
+            stream.flush()
+            return
+        # Flush pending print() text first so it stays ahead of this line
+        stream.flush()
+        buffer.write(payload)
+        buffer.flush()
 
     def _sanitize(self, log_entry: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -102,24 +168,21 @@ class StructuredLogger:
             log_entry: Log entry dictionary
 
         Returns:
-            Sanitized log entry
+            Sanitized log entry (the same dict if nothing needs redacting)
         """
-        SENSITIVE_KEYS = {
-            "token",
-            "session_token",
-            "password",
-            "secret",
-            "api_key",
-            "authorization",
-            "verification_token",
-            "SECRET_KEY",
-            "DATABASE_URL",
-        }
+        # Fast path: no sensitive keys and no nested dicts - return as-is
+        for key, value in log_entry.items():
+            lowered = key.lower()
+            if lowered in SENSITIVE_KEYS or "token" in lowered or isinstance(value, dict):
+                break
+        else:
+            return log_entry
 
         sanitized = {}
         for key, value in log_entry.items():
             # Check if key is sensitive (case-insensitive)
-            if key.lower() in SENSITIVE_KEYS or "token" in key.lower():
+            lowered = key.lower()
+            if lowered in SENSITIVE_KEYS or "token" in lowered:
                 sanitized[key] = "[REDACTED]"
             # Recursively sanitize nested dicts
             elif isinstance(value, dict):
@@ -140,6 +203,8 @@ class StructuredLogger:
         Example:
             log.info("user_authenticated", user_id="123", tier="lightweight")
         """
+        if self.min_level > LOG_LEVELS["INFO"]:
+            return
         self._log("INFO", event, **kwargs)
 
     def warning(self, event: str, **kwargs: Any) -> None:
@@ -153,6 +218,8 @@ class StructuredLogger:
         Example:
             log.warning("token_refresh_failed", reason="expired", user_id="123")
         """
+        if self.min_level > LOG_LEVELS["WARNING"]:
+            return
         self._log("WARNING", event, **kwargs)
 
     def error(self, event: str, **kwargs: Any) -> None:
@@ -166,6 +233,8 @@ class StructuredLogger:
         Example:
             log.error("rate_limit_exceeded", endpoint="/chat/save", retry_after=17)
         """
+        if self.min_level > LOG_LEVELS["ERROR"]:
+            return
         self._log("ERROR", event, **kwargs)
 
     def debug(self, event: str, **kwargs: Any) -> None:
@@ -179,6 +248,8 @@ class StructuredLogger:
         Example:
             log.debug("cache_hit", key="session_token_abc123")
         """
+        if self.min_level > LOG_LEVELS["DEBUG"]:
+            return
         self._log("DEBUG", event, **kwargs)
 
 
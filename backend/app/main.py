@@ -12,27 +12,37 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi import FastAPI, HTTPException, Header, Depends, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
-from sqlalchemy import text
+from pydantic import BaseModel, ConfigDict, ValidationError
+from sqlalchemy import delete, or_, text
 from sqlalchemy.orm import Session
 from typing import Literal, Optional
 from datetime import datetime, timedelta
+from collections import deque
+from contextlib import asynccontextmanager
+from itertools import chain
+import asyncio
+import base64
+import hashlib
 import secrets
-import re
 import os
+import threading
+import time
+import orjson
 
 # Configuration (Phase 11A)
 from app import config
 
 # Database and models
-from app.database import engine, get_db, Base
+from app.database import engine, get_db, init_db
 from app.models import User, Session as DBSession, VerificationToken, SavedChat, AnonymousSession, AnalyticsEvent
 
 # Services
-from app.services import email_service, personalize_service, analytics_service
+from app.services import email_service, personalize_service, analytics_service, maintenance_service
 
 # Test fixtures (Phase 11A)
 from app import test_fixtures
@@ -40,13 +50,83 @@ from app import test_fixtures
 # Rate limiter (Phase 11B)
 from app import rate_limiter
 
-# Middleware (Phase 13A)
-from app.middleware import RequestIDMiddleware
+# Middleware (Phase 11C, 13A)
+from app.middleware import RequestIDMiddleware, SecurityHeadersMiddleware
 
 # Logger (Phase 13B)
 from app.logger import log
 
-app = FastAPI(title="ChatKit API", version="0.4.0-dev")
+# Metrics (Phase 13D)
+from app.metrics import metrics
+
+# ===== Startup/Shutdown =====
+
+def clear_analytics_events() -> None:
+    """Clear analytics table for fresh test runs"""
+    db = next(get_db())
+    try:
+        if engine.dialect.name == "postgresql":
+            db.execute(text("TRUNCATE TABLE analytics_events"))
+        else:
+            db.query(AnalyticsEvent).delete()  # SQLite has no TRUNCATE
+        db.commit()
+        log.info("analytics_table_cleared")
+    except Exception as e:
+        log.warning("analytics_table_clear_failed", error=str(e))
+    finally:
+        db.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Initialize database and background workers on startup, drain them on shutdown.
+
+    Schema creation and fixture seeding issue blocking SQL, so they run in a
+    worker thread instead of stalling the event loop during boot.
+    """
+    if config.DB_AUTO_CREATE:
+        await asyncio.to_thread(init_db)
+        log.info("database_initialized")
+
+    # Phase 11A: Integration test mode diagnostics
+    if config.INTEGRATION_TEST_MODE:
+        log.info(
+            "integration_test_mode_enabled",
+            rate_limit_window_seconds=config.RATE_LIMIT_WINDOW_SECONDS,
+            email_enabled=config.EMAIL_ENABLED,
+            cors_origins=config.CORS_ORIGINS,
+        )
+
+        await asyncio.to_thread(clear_analytics_events)
+
+        # Setup deterministic test fixtures
+        await asyncio.to_thread(test_fixtures.setup_integration_test_fixtures)
+    else:
+        log.info("production_mode", **config.get_integration_test_diagnostics())
+
+    # Background workers: batched analytics writes, verification emails,
+    # periodic cleanup
+    analytics_service.start()
+    email_service.start()
+    maintenance_service.start()
+
+    yield
+
+    # Flush queued analytics events and emails, stop background tasks
+    await analytics_service.stop()
+    await email_service.stop()
+    await maintenance_service.stop()
+
+
+# ORJSONResponse: orjson encoding for every route. Routes return plain dicts and
+# list their contract model under `responses=` (OpenAPI docs only), so responses
+# skip a second Pydantic validation pass.
+app = FastAPI(
+    title="ChatKit API",
+    version="0.4.0-dev",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Phase 13A: Request ID Middleware (must be first for tracing)
 app.add_middleware(RequestIDMiddleware)
@@ -56,32 +136,15 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=config.CORS_ORIGINS,  # Explicit allowlist (not *)
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists: Starlette builds the preflight response headers once
+    # instead of echoing Access-Control-Request-Headers on every preflight
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
+    expose_headers=["X-Request-ID"],  # Widget reads it for error correlation
 )
 
-# Phase 11C: Security Headers Middleware
-@app.middleware("http")
-async def add_security_headers(request, call_next):
-    """Add security headers to all responses"""
-    response = await call_next(request)
-
-    # Prevent MIME type sniffing
-    response.headers["X-Content-Type-Options"] = "nosniff"
-
-    # Prevent clickjacking attacks
-    response.headers["X-Frame-Options"] = "DENY"
-
-    # Control referrer information
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-    # Content Security Policy (basic, can be enhanced)
-    response.headers["Content-Security-Policy"] = "default-src 'self'"
-
-    # XSS Protection (legacy, but still useful for older browsers)
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-
-    return response
+# Phase 11C: Security Headers Middleware (pure ASGI)
+app.add_middleware(SecurityHeadersMiddleware)
 
 # Phase 13C: Global Exception Handler
 @app.exception_handler(Exception)
@@ -111,7 +174,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
     # Return structured error response
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "internal_error",
@@ -127,95 +190,46 @@ async def global_exception_handler(request: Request, exc: Exception):
 widget_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "packages", "widget", "dist"))
 if os.path.exists(widget_path):
     app.mount("/widget", StaticFiles(directory=widget_path), name="widget")
-    print(f"✅ Widget files mounted at /widget from {widget_path}")
+    log.info("widget_mounted", path=widget_path)
 else:
-    print(f"⚠️  Widget directory not found at {widget_path}")
+    log.warning("widget_directory_missing", path=widget_path)
 
-# ===== Startup/Shutdown =====
-
-@app.on_event("startup")
-async def startup():
-    """Initialize database on startup"""
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database initialized")
-
-    # Phase 11A: Integration test mode diagnostics
-    if config.INTEGRATION_TEST_MODE:
-        print("🧪 INTEGRATION TEST MODE ENABLED")
-        print(f"   Rate limit window: {config.RATE_LIMIT_WINDOW_SECONDS}s")
-        print(f"   Email disabled: {not config.EMAIL_ENABLED}")
-        print(f"   CORS origins: {config.CORS_ORIGINS}")
+# ===== Phase 13D: Observability Endpoints =====
 
-        # Clear analytics table for fresh test runs
-        db = next(get_db())
-        try:
-            db.query(AnalyticsEvent).delete()
-            db.commit()
-            print("   ✅ Analytics table cleared for testing")
-        except Exception as e:
-            print(f"   ⚠️  Failed to clear analytics: {e}")
-        finally:
-            db.close()
+# Last DB probe for /health: probers (load balancers, uptime checks) share one
+# SELECT 1 per HEALTH_CACHE_TTL_SECONDS instead of each hitting the database
+_health_cache = {"checked_at": float("-inf"), "db_status": "unknown"}
+_health_lock = threading.Lock()
 
-        # Setup deterministic test fixtures
-        test_fixtures.setup_integration_test_fixtures()
-    else:
-        diagnostics = config.get_integration_test_diagnostics()
-        print(f"🚀 Production mode: {diagnostics}")
+def probe_database() -> str:
+    """
+    Return "connected" or "disconnected", probing the DB at most once per TTL.
 
-# ===== Phase 13D: Metrics Tracking =====
+    Concurrent callers on a stale cache wait for a single probe (single-flight).
+    """
+    if time.monotonic() - _health_cache["checked_at"] < config.HEALTH_CACHE_TTL_SECONDS:
+        return _health_cache["db_status"]
 
-from datetime import datetime as dt
-import time
+    with _health_lock:
+        # Another thread may have refreshed the cache while we waited
+        if time.monotonic() - _health_cache["checked_at"] < config.HEALTH_CACHE_TTL_SECONDS:
+            return _health_cache["db_status"]
 
-# Simple in-memory metrics (Phase 13D: Minimal metrics, not Prometheus cosplay)
-class MetricsTracker:
-    """Lightweight metrics tracker for operational visibility."""
-
-    def __init__(self):
-        self.startup_time = time.time()
-        self.total_requests = 0
-        self.error_count = 0
-        self.rate_limit_hits = 0
-        self.response_times = []  # Last 100 response times
-
-    def record_request(self, response_time_ms: float, is_error: bool = False):
-        """Record a request."""
-        self.total_requests += 1
-        if is_error:
-            self.error_count += 1
-
-        # Keep last 100 response times for avg calculation
-        self.response_times.append(response_time_ms)
-        if len(self.response_times) > 100:
-            self.response_times.pop(0)
-
-    def record_rate_limit(self):
-        """Record a rate limit hit."""
-        self.rate_limit_hits += 1
-
-    def get_uptime_seconds(self) -> int:
-        """Get server uptime in seconds."""
-        return int(time.time() - self.startup_time)
-
-    def get_avg_response_ms(self) -> float:
-        """Get average response time in milliseconds."""
-        if not self.response_times:
-            return 0.0
-        return sum(self.response_times) / len(self.response_times)
-
-    def get_error_rate(self) -> float:
-        """Get error rate as percentage."""
-        if self.total_requests == 0:
-            return 0.0
-        return (self.error_count / self.total_requests) * 100
-
-metrics = MetricsTracker()
+        try:
+            # Simple query to verify DB is responsive (pooled Core connection)
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            db_status = "connected"
+        except Exception as e:
+            log.error("health_check_db_failure", error=str(e))
+            db_status = "disconnected"
 
-# ===== Phase 13D: Observability Endpoints =====
+        _health_cache["db_status"] = db_status
+        _health_cache["checked_at"] = time.monotonic()
+        return db_status
 
 @app.get("/health")
-async def health_check():
+def health_check():
     """
     Health check endpoint.
 
@@ -226,17 +240,8 @@ async def health_check():
         500: Service is unhealthy
     """
     try:
-        # Check database connectivity
-        db = next(get_db())
-        try:
-            # Simple query to verify DB is responsive
-            db.execute(text("SELECT 1"))
-            db_status = "connected"
-        except Exception as e:
-            log.error("health_check_db_failure", error=str(e))
-            db_status = "disconnected"
-        finally:
-            db.close()
+        # Check database connectivity (cached briefly, see probe_database)
+        db_status = probe_database()
 
         # Health check response
         health_data = {
@@ -248,11 +253,11 @@ async def health_check():
         # Return 200 if healthy, 500 if degraded
         status_code = 200 if db_status == "connected" else 500
 
-        return JSONResponse(content=health_data, status_code=status_code)
+        return ORJSONResponse(content=health_data, status_code=status_code)
 
     except Exception as e:
         log.error("health_check_failure", error=str(e))
-        return JSONResponse(
+        return ORJSONResponse(
             content={"status": "error", "database": "unknown", "uptime_seconds": 0},
             status_code=500
         )
@@ -268,8 +273,11 @@ async def metrics_lite():
     - total_requests: Total HTTP requests handled
     - error_rate: Percentage of requests that errored
     - rate_limit_hits: Number of rate limit triggers
-    - avg_response_ms: Average response time (last 100 requests)
+    - avg_response_ms: Average response time (last 128 requests)
     - uptime_seconds: Server uptime
+    - analytics_queue_depth / analytics_queue_depth_max: Queued analytics events (now / peak)
+    - analytics_dropped_total: Analytics events dropped because the queue was full
+    - rt_ring_wraps: Times the response-time window has been fully overwritten
 
     Security: No secrets exposed.
     """
@@ -280,108 +288,194 @@ async def metrics_lite():
         "rate_limit_hits": metrics.rate_limit_hits,
         "avg_response_ms": round(metrics.get_avg_response_ms(), 2),
         "uptime_seconds": metrics.get_uptime_seconds(),
+        "analytics_queue_depth": analytics_service.queue_depth,
+        "analytics_queue_depth_max": metrics.analytics_queue_depth_max,
+        "analytics_dropped_total": metrics.analytics_dropped,
+        "rt_ring_wraps": metrics.get_rt_ring_wraps(),
     }
 
 # ===== Pydantic Models (API Contracts) =====
 
-class SignupRequest(BaseModel):
+class APIModel(BaseModel):
+    """Base for API contracts: immutable, unknown fields ignored."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+class SignupRequest(APIModel):
     email: str
     consent_data_storage: bool
     migrate_session: Optional[bool] = None
 
-class SignupResponse(BaseModel):
+class SignupResponse(APIModel):
     status: Literal["verification_sent"]
 
-class VerifyRequest(BaseModel):
+class VerifyRequest(APIModel):
     token: str
 
-class UserProfile(BaseModel):
+class UserProfile(APIModel):
     email: str
     tier: str
 
-class VerifyResponse(BaseModel):
+class VerifyResponse(APIModel):
     session_token: str
     user_profile: UserProfile
 
-class SaveChatRequest(BaseModel):
+class SaveChatRequest(APIModel):
     messages: list[dict]
     title: Optional[str] = None
 
-class SaveChatResponse(BaseModel):
+class SaveChatResponse(APIModel):
     chat_id: str
     saved_at: str
 
-class PersonalizeRequest(BaseModel):
+class PersonalizeRequest(APIModel):
     preferences: Optional[dict] = None
 
-class PersonalizeResponse(BaseModel):
+class PersonalizeResponse(APIModel):
     recommendations: list[str]
     personalized_content: dict
 
-class ResendVerificationRequest(BaseModel):
+class ResendVerificationRequest(APIModel):
     email: str
 
-class ResendVerificationResponse(BaseModel):
+class ResendVerificationResponse(APIModel):
     status: Literal["verification_sent"]
 
-class MigrateSessionRequest(BaseModel):
+class MigrateSessionRequest(APIModel):
     anon_id: str
 
-class MigrateSessionResponse(BaseModel):
+class MigrateSessionResponse(APIModel):
     migrated_messages: int
 
-class AnalyticsEventRequest(BaseModel):
+class AnalyticsEventRequest(APIModel):
     event_type: str
     event_data: Optional[dict] = None
 
-class AnalyticsEventResponse(BaseModel):
+class AnalyticsEventResponse(APIModel):
     event_id: int
     logged_at: str
 
+# ===== Error Details =====
+
+# Constant error bodies, built once at import. A fresh HTTPException is still
+# raised each time: re-raising one shared instance keeps growing its traceback.
+ERR_UNAUTHORIZED = {"error": {"code": "UNAUTHORIZED", "message": "Authorization header required"}}
+ERR_SESSION_EXPIRED = {"error": {"code": "SESSION_EXPIRED", "message": "Session has expired or is invalid"}}
+ERR_INVALID_EMAIL = {"error": {"code": "INVALID_EMAIL", "message": "Please enter a valid email address"}}
+ERR_CONSENT_REQUIRED = {"error": {"code": "CONSENT_REQUIRED", "message": "You must consent to data storage"}}
+ERR_INVALID_TOKEN = {"error": {"code": "INVALID_TOKEN", "message": "Invalid or expired verification token"}}
+ERR_SESSION_NOT_FOUND = {"error": {"code": "SESSION_NOT_FOUND", "message": "Anonymous session not found"}}
+
 # ===== Helper Functions =====
 
 def is_valid_email(email: str) -> bool:
-    """Validate email format"""
-    pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-    return re.match(pattern, email) is not None
+    """
+    Validate email format: local@domain.tld with no whitespace.
+
+    Same rules as the regex [^\s@]+@[^\s@]+\.[^\s@]+ (full match), checked
+    with C-level string scans instead of the regex engine.
+    """
+    at = email.find("@")
+    if at < 1 or email.find("@", at + 1) != -1:
+        return False
+    # Domain needs a dot with at least one character on each side
+    if email.find(".", at + 2, len(email) - 1) == -1:
+        return False
+    return not any(map(str.isspace, email))
+
+# Verification links are valid for 10 minutes (built once, not per signup)
+VERIFICATION_TOKEN_TTL = timedelta(minutes=10)
+
+# Pre-generated URL-safe tokens, refilled from one os.urandom() call per batch
+_TOKEN_BYTES = 32
+_TOKEN_BATCH = 256
+_token_pool: deque = deque()
+
+def generate_token() -> str:
+    """
+    Return a random URL-safe token (same format as secrets.token_urlsafe(32)).
+
+    Tokens are drawn from a pool filled _TOKEN_BATCH at a time, so the
+    entropy syscall and base64 setup are paid once per batch.
+    """
+    try:
+        return _token_pool.popleft()
+    except IndexError:
+        entropy = secrets.token_bytes(_TOKEN_BYTES * _TOKEN_BATCH)
+        _token_pool.extend(
+            base64.urlsafe_b64encode(entropy[i:i + _TOKEN_BYTES]).rstrip(b"=").decode("ascii")
+            for i in range(_TOKEN_BYTES, len(entropy), _TOKEN_BYTES)
+        )
+        return base64.urlsafe_b64encode(entropy[:_TOKEN_BYTES]).rstrip(b"=").decode("ascii")
 
-def validate_token(authorization: str | None, db: Session) -> DBSession:
-    """Validate authorization header and return session"""
+def validate_token(authorization: str | None, db: Session) -> tuple[DBSession, User]:
+    """Validate authorization header and return (session, user) in one query"""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
             status_code=401,
-            detail={"error": {"code": "UNAUTHORIZED", "message": "Authorization header required"}}
+            detail=ERR_UNAUTHORIZED
         )
 
     token = authorization[7:]
-    session = db.query(DBSession).filter(DBSession.session_token == token).first()
+    row = db.query(DBSession, User).join(User, User.id == DBSession.user_id).filter(
+        DBSession.session_token == token,
+        or_(DBSession.expires_at.is_(None), DBSession.expires_at > datetime.utcnow()),
+    ).first()
 
-    if not session:
+    if not row:
         raise HTTPException(
             status_code=401,
-            detail={"error": {"code": "SESSION_EXPIRED", "message": "Session has expired or is invalid"}}
+            detail=ERR_SESSION_EXPIRED
         )
 
-    return session
+    return row
+
+def get_auth(
+    authorization: str = Header(None),
+    db: Session = Depends(get_db)
+) -> tuple[DBSession, User]:
+    """
+    Dependency: validated (session, user) for the current request.
+
+    FastAPI caches dependency results per request, so every Depends(get_auth)
+    within a request shares one lookup.
+    """
+    return validate_token(authorization, db)
+
+def conditional_json(request: Request, content: dict) -> Response:
+    """
+    JSON response with an ETag for polled, per-user GET endpoints.
+
+    The browser cache revalidates with If-None-Match; an unchanged body is
+    answered with an empty 304 instead of being sent again.
+    """
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 # ===== Auth Endpoints =====
 
-@app.post("/api/v1/auth/signup", response_model=SignupResponse)
-async def signup(request: SignupRequest, db: Session = Depends(get_db)):
+# Endpoints doing (sync) SQLAlchemy work are plain `def` so FastAPI runs them
+# in its threadpool instead of blocking the event loop.
+
+@app.post("/api/v1/auth/signup", responses={200: {"model": SignupResponse}})
+def signup(request: SignupRequest, db: Session = Depends(get_db)):
     """User signup with email verification"""
 
     # Validate email
     if not is_valid_email(request.email):
         raise HTTPException(
             status_code=400,
-            detail={"error": {"code": "INVALID_EMAIL", "message": "Please enter a valid email address"}}
+            detail=ERR_INVALID_EMAIL
         )
 
     # Validate consent
     if not request.consent_data_storage:
         raise HTTPException(
             status_code=400,
-            detail={"error": {"code": "CONSENT_REQUIRED", "message": "You must consent to data storage"}}
+            detail=ERR_CONSENT_REQUIRED
         )
 
     # Create or get user
@@ -393,8 +487,8 @@ async def signup(request: SignupRequest, db: Session = Depends(get_db)):
         db.refresh(user)
 
     # Create verification token
-    token = secrets.token_urlsafe(32)
-    expires_at = datetime.utcnow() + timedelta(minutes=10)
+    token = generate_token()
+    expires_at = datetime.utcnow() + VERIFICATION_TOKEN_TTL
 
     verification = VerificationToken(
         email=request.email,
@@ -405,35 +499,29 @@ async def signup(request: SignupRequest, db: Session = Depends(get_db)):
     db.add(verification)
     db.commit()
 
-    # Send email (via service)
-    await email_service.send_verification_email(request.email, token)
+    # Send email (via service, in the background)
+    email_service.queue_verification_email(request.email, token)
 
     # Log analytics event
-    await analytics_service.log_event(db, "signup", user_email=request.email)
+    analytics_service.queue_event("signup", user_email=request.email)
 
-    return SignupResponse(status="verification_sent")
+    return {"status": "verification_sent"}
 
-@app.post("/api/v1/auth/verify", response_model=VerifyResponse)
-async def verify(request: VerifyRequest, db: Session = Depends(get_db)):
+@app.post("/api/v1/auth/verify", responses={200: {"model": VerifyResponse}})
+def verify(request: VerifyRequest, db: Session = Depends(get_db)):
     """Verify email with token"""
 
-    # Find token
+    # Find unused, unexpired token (expiry checked in SQL, one index probe)
     verification = db.query(VerificationToken).filter(
         VerificationToken.token == request.token,
-        VerificationToken.used == False
+        VerificationToken.used == False,
+        VerificationToken.expires_at > datetime.utcnow()
     ).first()
 
     if not verification:
         raise HTTPException(
             status_code=400,
-            detail={"error": {"code": "INVALID_TOKEN", "message": "Invalid or expired verification token"}}
-        )
-
-    # Check expiration
-    if datetime.utcnow() > verification.expires_at:
-        raise HTTPException(
-            status_code=400,
-            detail={"error": {"code": "TOKEN_EXPIRED", "message": "Verification token has expired"}}
+            detail=ERR_INVALID_TOKEN
         )
 
     # Mark token as used
@@ -445,78 +533,84 @@ async def verify(request: VerifyRequest, db: Session = Depends(get_db)):
         user.email_verified = True
 
     # Create session
-    session_token = secrets.token_urlsafe(32)
+    session_token = generate_token()
+    now = datetime.utcnow()
     session = DBSession(
         user_id=user.id,
         session_token=session_token,
-        created_at=datetime.utcnow(),
-        last_activity=datetime.utcnow()
+        created_at=now,
+        last_activity=now
     )
     db.add(session)
     db.commit()
 
     # Log analytics event
-    await analytics_service.log_event(db, "email_verified", user_email=user.email)
+    analytics_service.queue_event("email_verified", user_email=user.email)
 
-    return VerifyResponse(
-        session_token=session_token,
-        user_profile=UserProfile(email=user.email, tier=user.tier)
-    )
+    return {
+        "session_token": session_token,
+        "user_profile": {"email": user.email, "tier": user.tier}
+    }
 
 @app.get("/api/v1/auth/session-check")
-async def session_check(authorization: str = Header(None), db: Session = Depends(get_db)):
+def session_check(request: Request, auth: tuple[DBSession, User] = Depends(get_auth), db: Session = Depends(get_db)):
     """Check session validity"""
-    session = validate_token(authorization, db)
-    user = db.query(User).filter(User.id == session.user_id).first()
-
-    # Update last activity
-    session.last_activity = datetime.utcnow()
-    db.commit()
+    session, user = auth
+
+    # Update last activity (debounced: session-check is polled, so skip the
+    # UPDATE unless the stored value is older than the write interval)
+    now = datetime.utcnow()
+    if (
+        session.last_activity is None
+        or (now - session.last_activity).total_seconds() > config.SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS
+    ):
+        session.last_activity = now
+        db.commit()
 
-    return {
+    return conditional_json(request, {
         "valid": True,
-        "user": UserProfile(email=user.email, tier=user.tier)
-    }
+        "user": {"email": user.email, "tier": user.tier}
+    })
 
 @app.get("/api/v1/auth/verification-status")
-async def verification_status(authorization: str = Header(None), db: Session = Depends(get_db)):
+def verification_status(request: Request, auth: tuple[DBSession, User] = Depends(get_auth)):
     """Check email verification status"""
-    session = validate_token(authorization, db)
-    user = db.query(User).filter(User.id == session.user_id).first()
+    _, user = auth
 
-    return {"verified": user.email_verified}
+    return conditional_json(request, {"verified": user.email_verified})
 
 @app.post("/api/v1/auth/refresh-token")
-async def refresh_token(authorization: str = Header(None), db: Session = Depends(get_db)):
+def refresh_token(auth: tuple[DBSession, User] = Depends(get_auth), db: Session = Depends(get_db)):
     """Refresh session token"""
-    old_session = validate_token(authorization, db)
+    old_session, _ = auth
 
     # Create new token
-    new_token = secrets.token_urlsafe(32)
+    new_token = generate_token()
+    now = datetime.utcnow()
     new_session = DBSession(
         user_id=old_session.user_id,
         session_token=new_token,
-        created_at=datetime.utcnow(),
-        last_activity=datetime.utcnow()
+        created_at=now,
+        last_activity=now
     )
     db.add(new_session)
     db.commit()
 
     return {"token": new_token}
 
-@app.post("/api/v1/auth/resend-verification", response_model=ResendVerificationResponse)
-async def resend_verification(request: ResendVerificationRequest, db: Session = Depends(get_db)):
+@app.post("/api/v1/auth/resend-verification", responses={200: {"model": ResendVerificationResponse}})
+def resend_verification(request: ResendVerificationRequest, db: Session = Depends(get_db)):
     """Resend verification email"""
 
     if not is_valid_email(request.email):
         raise HTTPException(
             status_code=400,
-            detail={"error": {"code": "INVALID_EMAIL", "message": "Please enter a valid email address"}}
+            detail=ERR_INVALID_EMAIL
         )
 
     # Create new token
-    token = secrets.token_urlsafe(32)
-    expires_at = datetime.utcnow() + timedelta(minutes=10)
+    token = generate_token()
+    expires_at = datetime.utcnow() + VERIFICATION_TOKEN_TTL
 
     verification = VerificationToken(
         email=request.email,
@@ -527,27 +621,30 @@ async def resend_verification(request: ResendVerificationRequest, db: Session =
     db.add(verification)
     db.commit()
 
-    # Send email
-    await email_service.send_verification_email(request.email, token)
+    # Send email (in the background)
+    email_service.queue_verification_email(request.email, token)
 
-    return ResendVerificationResponse(status="verification_sent")
+    return {"status": "verification_sent"}
 
-@app.post("/api/v1/auth/migrate-session", response_model=MigrateSessionResponse)
-async def migrate_session(request: MigrateSessionRequest, authorization: str = Header(None), db: Session = Depends(get_db)):
+@app.post("/api/v1/auth/migrate-session", responses={200: {"model": MigrateSessionResponse}})
+def migrate_session(request: MigrateSessionRequest, auth: tuple[DBSession, User] = Depends(get_auth), db: Session = Depends(get_db)):
     """Migrate anonymous session to authenticated user"""
-    session = validate_token(authorization, db)
-    user = db.query(User).filter(User.id == session.user_id).first()
+    _, user = auth
 
-    # Find anonymous session
-    anon_session = db.query(AnonymousSession).filter(AnonymousSession.anon_id == request.anon_id).first()
+    # Delete anonymous session and fetch its messages in one statement
+    deleted = db.execute(
+        delete(AnonymousSession)
+        .where(AnonymousSession.anon_id == request.anon_id)
+        .returning(AnonymousSession.messages)
+    ).first()
 
-    if not anon_session:
+    if not deleted:
         raise HTTPException(
             status_code=404,
-            detail={"error": {"code": "SESSION_NOT_FOUND", "message": "Anonymous session not found"}}
+            detail=ERR_SESSION_NOT_FOUND
         )
 
-    messages = anon_session.messages
+    messages = deleted.messages
 
     # Create saved chat
     if messages:
@@ -559,22 +656,20 @@ async def migrate_session(request: MigrateSessionRequest, authorization: str = H
         )
         db.add(saved_chat)
 
-    # Delete anonymous session
-    db.delete(anon_session)
+    # Delete + insert commit together
     db.commit()
 
     # Log analytics event
-    await analytics_service.log_event(db, "anonymous_to_authenticated", user_email=user.email, event_data={"migrated_messages": len(messages)})
+    analytics_service.queue_event("anonymous_to_authenticated", user_email=user.email, event_data={"migrated_messages": len(messages)})
 
-    return MigrateSessionResponse(migrated_messages=len(messages))
+    return {"migrated_messages": len(messages)}
 
 # ===== Chat Endpoints =====
 
-@app.post("/api/v1/chat/save", response_model=SaveChatResponse)
-async def save_chat(request: SaveChatRequest, authorization: str = Header(None), db: Session = Depends(get_db)):
+@app.post("/api/v1/chat/save", responses={200: {"model": SaveChatResponse}})
+def save_chat(request: SaveChatRequest, auth: tuple[DBSession, User] = Depends(get_auth), db: Session = Depends(get_db)):
     """Save chat for authenticated user"""
-    session = validate_token(authorization, db)
-    user = db.query(User).filter(User.id == session.user_id).first()
+    session, user = auth
 
     # Phase 11B: Rate limit check (backend authority)
     allowed, retry_after = rate_limiter.check_rate_limit(db, session.session_token, "save_chat")
@@ -588,31 +683,31 @@ async def save_chat(request: SaveChatRequest, authorization: str = Header(None),
         )
 
     # Create saved chat
+    now = datetime.utcnow()
     saved_chat = SavedChat(
         user_id=user.id,
-        title=request.title or f"Chat {datetime.utcnow().strftime('%Y-%m-%d %H:%M')}",
+        title=request.title or f"Chat {now:%Y-%m-%d %H:%M}",
         messages=request.messages,
-        created_at=datetime.utcnow()
+        created_at=now
     )
     db.add(saved_chat)
     db.commit()
     db.refresh(saved_chat)
 
     # Log analytics event
-    await analytics_service.log_event(db, "save_chat", user_email=user.email, event_data={"chat_id": saved_chat.id})
+    analytics_service.queue_event("save_chat", user_email=user.email, event_data={"chat_id": saved_chat.id})
 
-    return SaveChatResponse(
-        chat_id=str(saved_chat.id),
-        saved_at=saved_chat.created_at.isoformat()
-    )
+    return {
+        "chat_id": str(saved_chat.id),
+        "saved_at": saved_chat.created_at.isoformat()
+    }
 
 # ===== User Endpoints =====
 
-@app.post("/api/v1/user/personalize", response_model=PersonalizeResponse)
-async def personalize(request: PersonalizeRequest, authorization: str = Header(None), db: Session = Depends(get_db)):
+@app.post("/api/v1/user/personalize", responses={200: {"model": PersonalizeResponse}})
+def personalize(request: PersonalizeRequest, auth: tuple[DBSession, User] = Depends(get_auth), db: Session = Depends(get_db)):
     """Generate personalized recommendations"""
-    session = validate_token(authorization, db)
-    user = db.query(User).filter(User.id == session.user_id).first()
+    session, user = auth
 
     # Phase 11B: Rate limit check (backend authority)
     allowed, retry_after = rate_limiter.check_rate_limit(db, session.session_token, "personalize")
@@ -625,14 +720,15 @@ async def personalize(request: PersonalizeRequest, authorization: str = Header(N
             }
         )
 
-    # Get user's saved chats for context
-    saved_chats = db.query(SavedChat).filter(SavedChat.user_id == user.id).all()
-    chat_history = []
-    for chat in saved_chats:
-        chat_history.extend(chat.messages)
+    # Get user's most recent saved chats for context (bounded, however long the history)
+    # Column-only select: plain rows, no SavedChat identity-map hydration
+    saved_messages = db.query(SavedChat.messages).filter(
+        SavedChat.user_id == user.id
+    ).order_by(SavedChat.created_at.desc()).limit(config.PERSONALIZE_CHAT_HISTORY_LIMIT).all()
+    chat_history = list(chain.from_iterable(row.messages for row in saved_messages))
 
     # Get recommendations from service
-    result = await personalize_service.get_recommendations(
+    result = personalize_service.get_recommendations(
         user_email=user.email,
         user_tier=user.tier,
         preferences=request.preferences,
@@ -640,51 +736,71 @@ async def personalize(request: PersonalizeRequest, authorization: str = Header(N
     )
 
     # Log analytics event
-    await analytics_service.log_event(db, "personalize", user_email=user.email)
+    analytics_service.queue_event("personalize", user_email=user.email)
 
-    return PersonalizeResponse(
-        recommendations=result["recommendations"],
-        personalized_content=result["personalized_content"]
-    )
+    return {
+        "recommendations": result["recommendations"],
+        "personalized_content": result["personalized_content"]
+    }
 
 # ===== Analytics Endpoints =====
 
-@app.post("/api/v1/analytics/event", response_model=AnalyticsEventResponse)
+@app.post(
+    "/api/v1/analytics/event",
+    responses={200: {"model": AnalyticsEventResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": AnalyticsEventRequest.model_json_schema()}},
+        }
+    },
+)
 async def log_analytics_event(
-    request: AnalyticsEventRequest,
+    raw_request: Request,
     authorization: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
-    """Log analytics event (authenticated or anonymous)"""
+    """
+    Log analytics event (authenticated or anonymous)
+
+    Highest-volume endpoint (the widget calls it on every interaction): the
+    body is validated straight from raw JSON bytes by pydantic-core instead of
+    json.loads + dict validation, and the DB work runs in the threadpool.
+    """
+    try:
+        request = AnalyticsEventRequest.model_validate_json(await raw_request.body())
+    except ValidationError as e:
+        # Same 422 shape FastAPI produces for body validation errors
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+    return await run_in_threadpool(record_analytics_event, request, authorization, db)
 
+def record_analytics_event(request: AnalyticsEventRequest, authorization: Optional[str], db: Session) -> dict:
+    """Resolve the optional user and insert the event (blocking DB work)."""
     user_email = None
-    if authorization:
+    # Only a bearer header is worth a session lookup; anything else is
+    # logged as anonymous without touching the sessions table
+    if authorization and authorization.startswith("Bearer "):
         try:
-            session = validate_token(authorization, db)
-            user = db.query(User).filter(User.id == session.user_id).first()
+            _, user = validate_token(authorization, db)
             user_email = user.email
-        except:
+        except HTTPException:
             pass  # Allow anonymous events
 
     # Log event
-    event = await analytics_service.log_event(
+    event = analytics_service.log_event(
         db,
         event_type=request.event_type,
         user_email=user_email,
         event_data=request.event_data
     )
 
-    return AnalyticsEventResponse(
-        event_id=event.id,
-        logged_at=event.created_at.isoformat()
-    )
-
-# ===== Health Endpoint =====
-
-@app.get("/health")
-async def health():
-    """Health check"""
-    return {"status": "ok", "version": "0.2.0"}
+    return {
+        "event_id": event.id,
+        "logged_at": event.created_at.isoformat()
+    }
 
 if __name__ == "__main__":
     import uvicorn
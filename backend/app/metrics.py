@@ -0,0 +1,86 @@
+"""
+Metrics Tracker - Phase 13D: Minimal Metrics
+
+Simple in-memory metrics (not Prometheus cosplay) for operational visibility.
+Requests are recorded by RequestIDMiddleware; read via GET /metrics.
+"""
+
+import time
+from array import array
+
+# Response-time window size (power of two so the ring index is a bit mask)
+RESPONSE_TIME_WINDOW = 128
+
+
+class MetricsTracker:
+    """Lightweight metrics tracker for operational visibility."""
+
+    def __init__(self):
+        self.startup_time = time.monotonic()
+        self.total_requests = 0
+        self.error_count = 0
+        self.rate_limit_hits = 0
+
+        # Analytics queue saturation (recorded by AnalyticsService)
+        self.analytics_dropped = 0
+        self.analytics_queue_depth_max = 0
+
+        # Ring buffer of the last RESPONSE_TIME_WINDOW response times with a
+        # running sum, so recording and averaging are both O(1)
+        self._rt_buf = array("d", [0.0] * RESPONSE_TIME_WINDOW)
+        self._rt_head = 0
+        self._rt_count = 0
+        self._rt_sum = 0.0
+
+    def record_request(self, response_time_ms: float, is_error: bool = False):
+        """Record a request."""
+        self.total_requests += 1
+        if is_error:
+            self.error_count += 1
+
+        # Overwrite the oldest slot once the window is full
+        idx = self._rt_head & (RESPONSE_TIME_WINDOW - 1)
+        if self._rt_count == RESPONSE_TIME_WINDOW:
+            self._rt_sum -= self._rt_buf[idx]
+        else:
+            self._rt_count += 1
+        self._rt_buf[idx] = response_time_ms
+        self._rt_sum += response_time_ms
+        self._rt_head += 1
+
+    def record_rate_limit(self):
+        """Record a rate limit hit."""
+        self.rate_limit_hits += 1
+
+    def record_analytics_enqueue(self, queue_depth: int):
+        """Record the analytics queue depth after an event was queued."""
+        if queue_depth > self.analytics_queue_depth_max:
+            self.analytics_queue_depth_max = queue_depth
+
+    def record_analytics_drop(self):
+        """Record an analytics event dropped because the queue was full."""
+        self.analytics_dropped += 1
+
+    def get_rt_ring_wraps(self) -> int:
+        """Get how many times the response-time window has been overwritten."""
+        return self._rt_head // RESPONSE_TIME_WINDOW
+
+    def get_uptime_seconds(self) -> int:
+        """Get server uptime in seconds."""
+        return int(time.monotonic() - self.startup_time)
+
+    def get_avg_response_ms(self) -> float:
+        """Get average response time in milliseconds."""
+        if not self._rt_count:
+            return 0.0
+        return self._rt_sum / self._rt_count
+
+    def get_error_rate(self) -> float:
+        """Get error rate as percentage."""
+        if self.total_requests == 0:
+            return 0.0
+        return (self.error_count / self.total_requests) * 100
+
+
+# Global metrics instance
+metrics = MetricsTracker()
@@ -1,9 +1,11 @@
 """
 Middleware package for ChatKit Widget Backend.
 
+Phase 11C: Security headers middleware.
 Phase 13A: Request tracing and correlation middleware.
 """
 
 from .request_id import RequestIDMiddleware
+from .security_headers import SecurityHeadersMiddleware
 
-__all__ = ["RequestIDMiddleware"]
+__all__ = ["RequestIDMiddleware", "SecurityHeadersMiddleware"]
@@ -14,16 +14,23 @@ This middleware:
 Guarantee: Every backend log line contains a request_id.
 """
 
+import re
+import time
 import uuid
 from contextvars import ContextVar
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import metrics
 
 # Context variable for request ID (thread-safe, async-safe)
 request_id_ctx: ContextVar[str] = ContextVar("request_id", default="")
 
+# Accept UUID hex (32 chars), UUID with hyphens (36 chars), or reasonable
+# ASCII alphanumeric; matched on the raw header bytes, no decode needed
+_valid_request_id = re.compile(rb"[A-Za-z0-9-]{1,64}").fullmatch
+_uuid4 = uuid.uuid4
+
 
 def get_request_id() -> str:
     """
@@ -35,11 +42,13 @@ def get_request_id() -> str:
     return request_id_ctx.get()
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware to generate or extract request IDs for tracing.
 
     Phase 13A: Request Tracing & Correlation
+    Phase 13D: Also times each request into app.metrics (one middleware frame
+    for both, implemented as pure ASGI rather than BaseHTTPMiddleware).
 
     Usage:
         app.add_middleware(RequestIDMiddleware)
@@ -55,44 +64,61 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         - request_id_ctx (ContextVar): Global context variable for logging
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process each request and inject request ID.
+        Process each request: inject request ID, record timing.
 
         Args:
-            request: Incoming FastAPI request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            Response with X-Request-ID header
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Extract or generate request ID
-        request_id = request.headers.get("X-Request-ID", "")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        if not request_id:
-            # Generate new UUID if not provided by client
-            request_id = uuid.uuid4().hex
+        start = time.perf_counter()
 
-        # Validate request ID (basic sanity check)
-        # Accept: UUID hex (32 chars), UUID with hyphens (36 chars), or reasonable alphanumeric
-        if not request_id or len(request_id) > 64 or not request_id.replace("-", "").isalnum():
-            # Invalid request ID - generate new one for safety
-            request_id = uuid.uuid4().hex
+        # Extract or generate request ID
+        raw_request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                raw_request_id = value
+                break
+
+        if raw_request_id is not None and _valid_request_id(raw_request_id):
+            request_id = raw_request_id.decode("ascii")
+        else:
+            # Missing or invalid request ID - generate a new one
+            request_id = _uuid4().hex
+            raw_request_id = request_id.encode("ascii")
 
         # Attach to request state (accessible in route handlers)
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Set in context variable (accessible in logging)
         token = request_id_ctx.set(request_id)
 
-        try:
-            # Process request
-            response = await call_next(request)
+        status_code = 500
+        request_id_header = (b"x-request-id", raw_request_id)
 
-            # Attach request ID to response headers (echo back to client)
-            response.headers["X-Request-ID"] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Attach request ID to response headers (echo back to client)
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
 
-            return response
+        try:
+            await self.app(scope, receive, send_with_request_id)
         finally:
+            metrics.record_request(
+                (time.perf_counter() - start) * 1000,
+                is_error=status_code >= 500,
+            )
             # Clean up context variable
             request_id_ctx.reset(token)
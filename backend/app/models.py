@@ -4,7 +4,8 @@ Database Models - Phase 10
 SQLAlchemy models for persistent storage.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -56,6 +57,10 @@ class VerificationToken(Base):
 class SavedChat(Base):
     """Saved chat conversation model"""
     __tablename__ = "saved_chats"
+    __table_args__ = (
+        # Serves "user's most recent chats" (personalize) as an ordered index scan
+        Index("ix_saved_chats_user_id_created_at", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -80,9 +85,14 @@ class AnonymousSession(Base):
 class RateLimit(Base):
     """Rate limit tracking model"""
     __tablename__ = "rate_limits"
+    __table_args__ = (
+        # One counter row per (session, action); serves check_rate_limit's
+        # UPDATE and, by prefix, get_rate_limit_status's per-session scan
+        Index("ix_rate_limits_session_token_action", "session_token", "action", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    session_token = Column(String, index=True, nullable=False)
+    session_token = Column(String, nullable=False)
     action = Column(String, nullable=False)  # chat, save, personalize
     count = Column(Integer, default=0)
     window_start = Column(DateTime, default=datetime.utcnow)
@@ -91,11 +101,11 @@ class RateLimit(Base):
 class AnalyticsEvent(Base):
     """Analytics event model"""
     __tablename__ = "analytics_events"
-
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # NULL for anonymous
     event_type = Column(String, index=True, nullable=False)  # signup, login, save_chat, personalize, etc.
-    event_data = Column(JSON, nullable=True)  # Additional event metadata
+    # Additional event metadata; JSONB on Postgres (binary, supports @> filters)
+    event_data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -7,11 +7,25 @@ Frontend may predict, backend must enforce.
 Rate limits are stored in database and enforced on every request.
 """
 
+from sqlalchemy import case, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models import RateLimit
 from app import config
 from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+
+# Action-specific limits (config is read once at import)
+_MAX_FOR_ACTION: Dict[str, int] = {
+    "save_chat": config.RATE_LIMIT_SAVE_CHAT,
+    "personalize": config.RATE_LIMIT_PERSONALIZE,
+}
+_DEFAULT_MAX_REQUESTS = config.RATE_LIMIT_MAX_REQUESTS
+
+# Denied (session_token, action) -> window end. Within a fixed window a denial
+# cannot turn into an allow, so repeat attempts are answered without the DB.
+_denied_until: Dict[Tuple[str, str], datetime] = {}
+_DENIED_CACHE_MAX_SIZE = 10_000
 
 
 def check_rate_limit(
@@ -42,55 +56,73 @@ def check_rate_limit(
 
     if max_requests is None:
         # Action-specific limits
-        if action == 'save_chat':
-            max_requests = config.RATE_LIMIT_SAVE_CHAT
-        elif action == 'personalize':
-            max_requests = config.RATE_LIMIT_PERSONALIZE
-        else:
-            max_requests = config.RATE_LIMIT_MAX_REQUESTS
+        max_requests = _MAX_FOR_ACTION.get(action, _DEFAULT_MAX_REQUESTS)
 
-    # Calculate window start
     now = datetime.utcnow()
-    window_start = now - timedelta(seconds=window_seconds)
+    key = (session_token, action)
 
-    # Get or create rate limit record
-    rate_limit = db.query(RateLimit).filter(
-        RateLimit.session_token == session_token,
-        RateLimit.action == action
+    denied_until = _denied_until.get(key)
+    if denied_until is not None:
+        if now < denied_until:
+            return False, max(1, int((denied_until - now).total_seconds()))
+        _denied_until.pop(key, None)
+
+    # Calculate window start
+    window = timedelta(seconds=window_seconds)
+    window_start = now - window
+    expired = RateLimit.window_start < window_start
+
+    # One atomic statement: reset an expired window, otherwise count this
+    # request. Denied requests are counted too, so allowed <=> count <= max.
+    row = db.execute(
+        update(RateLimit)
+        .where(RateLimit.session_token == session_token, RateLimit.action == action)
+        .values(
+            count=case((expired, 1), else_=RateLimit.count + 1),
+            window_start=case((expired, now), else_=RateLimit.window_start),
+        )
+        .returning(RateLimit.count, RateLimit.window_start)
+        .execution_options(synchronize_session=False)
     ).first()
 
-    if not rate_limit:
+    if row is None:
         # First request for this action - create record
-        rate_limit = RateLimit(
+        db.add(RateLimit(
             session_token=session_token,
             action=action,
             count=1,
             window_start=now
-        )
-        db.add(rate_limit)
-        db.commit()
+        ))
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent request created the row first; count against it
+            db.rollback()
+            return check_rate_limit(db, session_token, action, max_requests, window_seconds)
         return True, 0
 
-    # Check if window has expired
-    if rate_limit.window_start < window_start:
-        # Window expired - reset counter
-        rate_limit.count = 1
-        rate_limit.window_start = now
-        db.commit()
+    db.commit()
+    count, current_window_start = row
+
+    if count <= max_requests:
         return True, 0
 
-    # Check if limit exceeded
-    if rate_limit.count >= max_requests:
-        # Rate limited - calculate retry_after
-        window_end = rate_limit.window_start + timedelta(seconds=window_seconds)
-        retry_after = int((window_end - now).total_seconds())
-        retry_after = max(1, retry_after)  # Minimum 1 second
-        return False, retry_after
+    # Rate limited - calculate retry_after
+    window_end = current_window_start + window
+    retry_after = int((window_end - now).total_seconds())
+    retry_after = max(1, retry_after)  # Minimum 1 second
+    _remember_denial(key, window_end, now)
+    return False, retry_after
 
-    # Under limit - increment counter
-    rate_limit.count += 1
-    db.commit()
-    return True, 0
+
+def _remember_denial(key: Tuple[str, str], window_end: datetime, now: datetime) -> None:
+    """Cache a denial until its window ends, dropping lapsed entries when full."""
+    if len(_denied_until) >= _DENIED_CACHE_MAX_SIZE:
+        for stale in [k for k, end in list(_denied_until.items()) if end <= now]:
+            _denied_until.pop(stale, None)
+        if len(_denied_until) >= _DENIED_CACHE_MAX_SIZE:
+            _denied_until.clear()
+    _denied_until[key] = window_end
 
 
 def reset_rate_limit(db: Session, session_token: str, action: str) -> None:
@@ -104,6 +136,8 @@ def reset_rate_limit(db: Session, session_token: str, action: str) -> None:
         session_token: User session token
         action: Action to reset
     """
+    _denied_until.pop((session_token, action), None)
+
     rate_limit = db.query(RateLimit).filter(
         RateLimit.session_token == session_token,
         RateLimit.action == action
@@ -133,19 +167,15 @@ def get_rate_limit_status(db: Session, session_token: str) -> dict:
 
     status = {}
     now = datetime.utcnow()
+    window_seconds = config.RATE_LIMIT_WINDOW_SECONDS
+    window = timedelta(seconds=window_seconds)
 
     for rl in rate_limits:
-        window_seconds = config.RATE_LIMIT_WINDOW_SECONDS
-        window_end = rl.window_start + timedelta(seconds=window_seconds)
+        window_end = rl.window_start + window
         remaining_seconds = int((window_end - now).total_seconds())
 
         # Get max requests for this action
-        if rl.action == 'save_chat':
-            max_requests = config.RATE_LIMIT_SAVE_CHAT
-        elif rl.action == 'personalize':
-            max_requests = config.RATE_LIMIT_PERSONALIZE
-        else:
-            max_requests = config.RATE_LIMIT_MAX_REQUESTS
+        max_requests = _MAX_FOR_ACTION.get(rl.action, _DEFAULT_MAX_REQUESTS)
 
         status[rl.action] = {
             "count": rl.count,
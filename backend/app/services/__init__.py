@@ -7,9 +7,11 @@ Modular service layer for business logic.
 from app.services.email_service import email_service
 from app.services.personalize_service import personalize_service
 from app.services.analytics_service import analytics_service
+from app.services.maintenance_service import maintenance_service
 
 __all__ = [
     "email_service",
     "personalize_service",
     "analytics_service",
+    "maintenance_service",
 ]
@@ -2,17 +2,180 @@
 Analytics Service - Phase 10
 
 Track user interactions and events for insights.
+
+Events raised as a side effect of other requests are queued in memory and
+written in batches by a background task, so they never add a database
+round-trip to the request path.
 """
 
+import asyncio
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
+from app import config
+from app.database import SessionLocal
+from app.logger import log
+from app.metrics import metrics
 from app.models import AnalyticsEvent, User
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from datetime import datetime
 
 class AnalyticsService:
     """Analytics event tracking service"""
 
-    async def log_event(
+    def __init__(self):
+        # Created in start() so it binds to the loop that drains it
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Dict] = []  # Batch being collected by the flush task
+
+    def queue_event(
+        self,
+        event_type: str,
+        user_email: Optional[str] = None,
+        event_data: Optional[Dict] = None
+    ) -> None:
+        """
+        Queue an analytics event for background batch insert.
+
+        Non-blocking: the event is timestamped now and written by the flush
+        task. If the queue is full the event is dropped (analytics must never
+        fail a request). Safe to call from threadpool (sync) endpoints.
+        Before start() or after stop() nothing drains the queue, so the event
+        is dropped.
+        """
+        loop = self._loop
+        if loop is None:
+            self._drop(event_type, "not_running")
+            return
+
+        event = {
+            "event_type": event_type,
+            "user_email": user_email,
+            "event_data": event_data or {},
+            "created_at": datetime.utcnow(),
+        }
+
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+
+        if on_loop:
+            self._put(event)
+            return
+
+        # asyncio.Queue is not thread-safe; enqueue on the loop thread
+        try:
+            loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The loop closed after the check above
+            self._drop(event_type, "not_running")
+
+    def _put(self, event: Dict) -> None:
+        queue = self._queue
+        if queue is None:
+            self._drop(event["event_type"], "not_running")
+            return
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._drop(event["event_type"], "queue_full")
+        else:
+            metrics.record_analytics_enqueue(queue.qsize())
+
+    def _drop(self, event_type: str, reason: str) -> None:
+        metrics.record_analytics_drop()
+        log.warning("analytics_event_dropped", event_type=event_type, reason=reason)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be written."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        """Start the background flush task (call from app startup)."""
+        if self._flush_task is None:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue(maxsize=config.ANALYTICS_QUEUE_MAX_SIZE)
+            self._flush_task = self._loop.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write any events still queued."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+            self._loop = None
+
+        batch, self._pending = self._pending, []
+        queue, self._queue = self._queue, None
+        while queue is not None and not queue.empty():
+            batch.append(queue.get_nowait())
+        if batch:
+            await asyncio.to_thread(self._write_batch, batch)
+
+    async def _flush_loop(self) -> None:
+        """Wait for events, collect a batch, write it off the event loop."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Dict] = []
+            try:
+                batch = self._pending = [await queue.get()]
+
+                # Give the batch a short window to fill up
+                deadline = loop.time() + config.ANALYTICS_FLUSH_INTERVAL_SECONDS
+                while len(batch) < config.ANALYTICS_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Hand the batch off; stop() must not write it a second time
+                self._pending = []
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                # Log and keep going; one bad batch must not end the worker
+                self._pending = []
+                log.error("analytics_flush_failed", events=len(batch), error=str(e))
+
+    def _write_batch(self, batch: List[Dict]) -> None:
+        """Insert a batch of queued events in one transaction."""
+        db = SessionLocal()
+        try:
+            # Resolve all user emails in a single query
+            emails = {e["user_email"] for e in batch if e["user_email"]}
+            user_ids = {}
+            if emails:
+                user_ids = dict(
+                    db.query(User.email, User.id).filter(User.email.in_(emails)).all()
+                )
+
+            # Core executemany (batched "insertmanyvalues" in SQLAlchemy 2.0)
+            db.execute(insert(AnalyticsEvent), [
+                {
+                    "user_id": user_ids.get(e["user_email"]),
+                    "event_type": e["event_type"],
+                    "event_data": e["event_data"],
+                    "created_at": e["created_at"],
+                }
+                for e in batch
+            ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def log_event(
         self,
         db: Session,
         event_type: str,
@@ -36,9 +199,7 @@ class AnalyticsService:
         # Get user_id if email provided
         user_id = None
         if user_email:
-            user = db.query(User).filter(User.email == user_email).first()
-            if user:
-                user_id = user.id
+            user_id = db.query(User.id).filter(User.email == user_email).scalar()
 
         # Create event
         event = AnalyticsEvent(
@@ -48,18 +209,24 @@ class AnalyticsService:
             created_at=datetime.utcnow()
         )
 
+        # flush() runs the INSERT and assigns event.id; detaching before the
+        # commit keeps id/created_at loaded, so callers reading them don't
+        # trigger a refresh SELECT
         db.add(event)
+        db.flush()
+        db.expunge(event)
         db.commit()
-        db.refresh(event)
 
-        print(f"📊 ANALYTICS EVENT LOGGED")
-        print(f"   Type: {event_type}")
-        print(f"   User: {user_email or 'anonymous'}")
-        print(f"   Data: {event_data}")
+        log.debug(
+            "analytics_event_logged",
+            event_type=event_type,
+            user_email=user_email or "anonymous",
+            event_data=event_data,
+        )
 
         return event
 
-    async def get_user_stats(self, db: Session, user_email: str) -> Dict:
+    def get_user_stats(self, db: Session, user_email: str) -> Dict:
         """
         Get analytics stats for a user.
 
@@ -75,14 +242,22 @@ class AnalyticsService:
         if not user:
             return {}
 
-        events = db.query(AnalyticsEvent).filter(AnalyticsEvent.user_id == user.id).all()
+        # One row per event type: (event_type, count, latest created_at)
+        rows = db.query(
+            AnalyticsEvent.event_type,
+            func.count(),
+            func.max(AnalyticsEvent.created_at),
+        ).filter(AnalyticsEvent.user_id == user.id).group_by(AnalyticsEvent.event_type).all()
+
+        counts = {event_type: count for event_type, count, _ in rows}
+        last_activity = max((last_at for _, _, last_at in rows), default=user.created_at)
 
         stats = {
-            "total_chats": sum(1 for e in events if e.event_type == "chat_message"),
-            "total_saves": sum(1 for e in events if e.event_type == "save_chat"),
-            "total_personalizations": sum(1 for e in events if e.event_type == "personalize"),
+            "total_chats": counts.get("chat_message", 0),
+            "total_saves": counts.get("save_chat", 0),
+            "total_personalizations": counts.get("personalize", 0),
             "signup_date": user.created_at.isoformat(),
-            "last_activity": max((e.created_at for e in events), default=user.created_at).isoformat(),
+            "last_activity": last_activity.isoformat(),
         }
 
         return stats
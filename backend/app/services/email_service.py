@@ -7,13 +7,31 @@ Currently using console logging (mock).
 Phase 11A: Respects EMAIL_ENABLED config (disabled in integration test mode).
 Phase 13B: Structured logging for observability.
 Production: Update with real SMTP credentials.
+
+Request handlers queue emails; a background task sends them so SMTP latency
+never shows up in signup/resend response times.
 """
 
+import asyncio
 import os
-from typing import Optional
+from typing import Optional, Tuple
 from app import config
 from app.logger import log
 
+# Verification email body; {link} is filled in per send
+VERIFICATION_EMAIL_HTML = """
+        <html>
+        <body>
+            <h2>Verify Your Email</h2>
+            <p>Thank you for signing up! Please click the link below to verify your email:</p>
+            <p><a href="{link}">Verify Email</a></p>
+            <p>Or copy this link: {link}</p>
+            <p>This link expires in 10 minutes.</p>
+            <p>If you didn't request this, please ignore this email.</p>
+        </body>
+        </html>
+        """
+
 class EmailService:
     """Email sending service"""
 
@@ -25,36 +43,104 @@ class EmailService:
         self.from_email = os.getenv("FROM_EMAIL", "noreply@chatkit.com")
         self.base_url = os.getenv("BASE_URL", "http://localhost:3000")
         self.email_enabled = config.EMAIL_ENABLED
+        # Created in start() so it binds to the loop that drains it
+        self._queue: Optional[asyncio.Queue] = None
+        self._send_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def queue_verification_email(self, to_email: str, token: str) -> None:
+        """
+        Queue a verification email for the background sender.
+
+        Non-blocking and safe to call from threadpool (sync) endpoints.
+        Before start() or after stop() nothing drains the queue, so the email
+        is dropped and logged.
+        """
+        loop = self._loop
+        if loop is None:
+            log.error("verification_email_dropped", to_email=to_email, reason="not_running")
+            return
+
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+
+        if on_loop:
+            self._put((to_email, token))
+            return
+
+        # asyncio.Queue is not thread-safe; enqueue on the loop thread
+        try:
+            loop.call_soon_threadsafe(self._put, (to_email, token))
+        except RuntimeError:
+            # The loop closed after the check above
+            log.error("verification_email_dropped", to_email=to_email, reason="not_running")
+
+    def _put(self, item: Tuple[str, str]) -> None:
+        queue = self._queue
+        if queue is None:
+            log.error("verification_email_dropped", to_email=item[0], reason="not_running")
+            return
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            log.error("verification_email_dropped", to_email=item[0], reason="queue_full")
+
+    def start(self) -> None:
+        """Start the background sender task (call from app startup)."""
+        if self._send_task is None:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue(maxsize=config.EMAIL_QUEUE_MAX_SIZE)
+            self._send_task = self._loop.create_task(self._send_loop())
+
+    async def stop(self) -> None:
+        """Stop the sender task and send any emails still queued."""
+        if self._send_task is not None:
+            self._send_task.cancel()
+            try:
+                await self._send_task
+            except asyncio.CancelledError:
+                pass
+            self._send_task = None
+            self._loop = None
+
+        queue, self._queue = self._queue, None
+        while queue is not None and not queue.empty():
+            await self._send_safely(*queue.get_nowait())
+
+    async def _send_loop(self) -> None:
+        """Send queued emails one at a time."""
+        queue = self._queue
+        while True:
+            try:
+                to_email, token = await queue.get()
+                await self._send_safely(to_email, token)
+            except Exception as e:
+                # Log and keep going; one failure must not end the sender
+                log.error("verification_email_loop_failed", error=str(e))
+
+    async def _send_safely(self, to_email: str, token: str) -> None:
+        try:
+            await self.send_verification_email(to_email, token)
+        except Exception as e:
+            log.error("verification_email_failed", to_email=to_email, error=str(e))
 
     async def send_verification_email(self, to_email: str, token: str) -> bool:
         """
         Send email verification link.
 
         Production TODO:
-        - Import smtplib, email.mime
+        - Install aiosmtplib (see requirements.txt)
         - Create MIME multipart message
-        - Connect to SMTP server
-        - Send email
+        - Send via aiosmtplib (async: the event loop keeps serving requests
+          during the SMTP round trip; blocking smtplib would stall it)
         - Return success/failure
 
         Current: Mock implementation (console log)
         """
         verification_link = f"{self.base_url}/verify?token={token}"
 
-        # Mock email template
-        email_html = f"""
-        <html>
-        <body>
-            <h2>Verify Your Email</h2>
-            <p>Thank you for signing up! Please click the link below to verify your email:</p>
-            <p><a href="{verification_link}">Verify Email</a></p>
-            <p>Or copy this link: {verification_link}</p>
-            <p>This link expires in 10 minutes.</p>
-            <p>If you didn't request this, please ignore this email.</p>
-        </body>
-        </html>
-        """
-
         # Phase 11A: Skip email sending in integration test mode
         if not self.email_enabled:
             # Phase 13B: Structured logging
@@ -73,7 +159,7 @@ class EmailService:
 
         # Production implementation:
         # try:
-        #     import smtplib
+        #     import aiosmtplib
         #     from email.mime.multipart import MIMEMultipart
         #     from email.mime.text import MIMEText
         #
@@ -82,20 +168,33 @@ class EmailService:
         #     msg['From'] = self.from_email
         #     msg['To'] = to_email
         #
-        #     html_part = MIMEText(email_html, 'html')
+        #     html_part = MIMEText(self.render_verification_html(verification_link), 'html')
         #     msg.attach(html_part)
         #
-        #     with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-        #         server.starttls()
-        #         server.login(self.smtp_user, self.smtp_password)
-        #         server.send_message(msg)
+        #     await aiosmtplib.send(
+        #         msg,
+        #         hostname=self.smtp_host,
+        #         port=self.smtp_port,
+        #         start_tls=True,
+        #         username=self.smtp_user,
+        #         password=self.smtp_password,
+        #     )
         #
         #     return True
         # except Exception as e:
-        #     print(f"❌ Email failed: {e}")
+        #     log.error("verification_email_failed", to_email=to_email, error=str(e))
         #     return False
 
         return True  # Mock always succeeds
 
+    def render_verification_html(self, verification_link: str) -> str:
+        """
+        Render the verification email body.
+
+        Only the real SMTP path needs the HTML, so the mock and test-mode
+        paths never build it.
+        """
+        return VERIFICATION_EMAIL_HTML.format_map({"link": verification_link})
+
 # Singleton instance
 email_service = EmailService()
@@ -0,0 +1,105 @@
+"""
+Maintenance Service - Periodic Cleanup
+
+Deletes rows that are never read again but keep hot lookup indexes growing:
+- verification tokens that are used or expired
+- sessions past their expiry
+- rate limit counters whose window ended at least one full window ago
+
+Runs as a background task started on app startup.
+"""
+
+import asyncio
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from app import config
+from app.database import SessionLocal
+from app.logger import log
+from app.models import RateLimit, Session as DBSession, VerificationToken
+from typing import Dict, Optional
+from datetime import datetime, timedelta
+
+class MaintenanceService:
+    """Periodic database cleanup service"""
+
+    def __init__(self):
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the periodic sweep task (call from app startup)."""
+        if self._sweep_task is None:
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self) -> None:
+        """Stop the sweep task."""
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
+    async def _sweep_loop(self) -> None:
+        """Run sweep() every MAINTENANCE_INTERVAL_SECONDS, off the event loop."""
+        while True:
+            await asyncio.sleep(config.MAINTENANCE_INTERVAL_SECONDS)
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                log.error("maintenance_sweep_failed", error=str(e))
+
+    def sweep(self) -> Dict[str, int]:
+        """
+        Run all cleanup steps in one transaction.
+
+        Returns:
+            dict: Rows deleted per cleanup step
+        """
+        db = SessionLocal()
+        try:
+            # Keys avoid "token" so the logger does not redact the counts
+            deleted = {
+                "verifications": self.purge_verification_tokens(db),
+                "sessions": self.purge_expired_sessions(db),
+                "rate_limits": self.purge_stale_rate_limits(db),
+            }
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        log.info("maintenance_sweep", **deleted)
+        return deleted
+
+    def purge_verification_tokens(self, db: Session) -> int:
+        """Delete verification tokens that can no longer be redeemed."""
+        return db.query(VerificationToken).filter(
+            or_(
+                VerificationToken.used == True,
+                VerificationToken.expires_at < datetime.utcnow(),
+            )
+        ).delete(synchronize_session=False)
+
+    def purge_expired_sessions(self, db: Session) -> int:
+        """Delete sessions past their expiry (NULL expires_at never expires)."""
+        return db.query(DBSession).filter(
+            DBSession.expires_at < datetime.utcnow(),
+        ).delete(synchronize_session=False)
+
+    def purge_stale_rate_limits(self, db: Session) -> int:
+        """
+        Delete rate limit rows older than two windows.
+
+        check_rate_limit resets such a row on its next use anyway, so deleting
+        it only drops counters for sessions that stopped making requests.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=2 * config.RATE_LIMIT_WINDOW_SECONDS)
+        return db.query(RateLimit).filter(
+            RateLimit.window_start < cutoff,
+        ).delete(synchronize_session=False)
+
+# Singleton instance
+maintenance_service = MaintenanceService()
@@ -7,8 +7,25 @@ Currently using rule-based logic (mock).
 Production: Integrate with ML model (e.g., collaborative filtering, LLM embeddings).
 """
 
+import re
+from app.logger import log
 from typing import List, Dict
-from datetime import datetime
+
+# Keyword -> topic for _extract_keywords. One alternation scans the whole chat
+# history once; the lookahead also reports overlapping hits, matching the
+# plain substring checks this replaced.
+_KEYWORD_TOPICS = {
+    "sensor": "sensor",
+    "perception": "perception",
+    "learning": "learning",
+    "train": "learning",
+    "control": "control",
+}
+_KEYWORD_RE = re.compile("(?=(" + "|".join(_KEYWORD_TOPICS) + "))")
+
+# Static parts of the mock personalized content, shared across requests
+_LEARNING_PATH = ("basics", "sensors", "control", "advanced")
+_RECOMMENDED_TOPICS = ("sensor fusion", "deep RL", "kinematics")
 
 class PersonalizeService:
     """Content personalization service"""
@@ -30,7 +47,14 @@ class PersonalizeService:
             "Case Study: Boston Dynamics Spot Robot",
         ]
 
-    async def get_recommendations(
+        # Per-tier starting lists, sliced once instead of on every request
+        self._tier_recommendations = {
+            "premium": tuple(self.all_recommendations[:7]),
+            "full": tuple(self.all_recommendations[:5]),
+            "lightweight": tuple(self.all_recommendations[:3]),
+        }
+
+    def get_recommendations(
         self,
         user_email: str,
         user_tier: str,
@@ -52,32 +76,32 @@ class PersonalizeService:
         """
 
         # Mock ML/AI logic (rule-based)
-        recommendations = []
-
-        # Tier-based filtering
-        if user_tier == "premium":
-            recommendations.extend(self.all_recommendations[:7])
-        elif user_tier == "full":
-            recommendations.extend(self.all_recommendations[:5])
-        else:  # lightweight
-            recommendations.extend(self.all_recommendations[:3])
+        # Boosted items go in front of the tier list; each later boost ranks
+        # above the earlier ones
+        boosted = []
 
         # Chat history analysis (mock)
         if chat_history:
             # Simple keyword matching
             keywords = self._extract_keywords(chat_history)
             if "sensor" in keywords or "perception" in keywords:
-                recommendations.insert(0, "Video: Understanding Sensor Fusion")
+                boosted.append("Video: Understanding Sensor Fusion")
             if "learning" in keywords or "training" in keywords:
-                recommendations.insert(0, "Video: Deep Reinforcement Learning for Robots")
+                boosted.append("Video: Deep Reinforcement Learning for Robots")
 
         # Preferences-based (mock)
         if preferences:
             difficulty = preferences.get("difficulty_level", "intermediate")
             if difficulty == "beginner":
-                recommendations.insert(0, "Tutorial: Building Your First Humanoid")
+                boosted.append("Tutorial: Building Your First Humanoid")
             elif difficulty == "advanced":
-                recommendations.insert(0, "Case Study: Boston Dynamics Spot Robot")
+                boosted.append("Case Study: Boston Dynamics Spot Robot")
+
+        # Tier-based filtering (unknown tiers get the lightweight list)
+        tier_recommendations = (
+            self._tier_recommendations.get(user_tier) or self._tier_recommendations["lightweight"]
+        )
+        recommendations = [*reversed(boosted), *tier_recommendations]
 
         # Deduplicate and limit
         recommendations = list(dict.fromkeys(recommendations))[:5]
@@ -85,17 +109,19 @@ class PersonalizeService:
         # Mock personalized content metadata
         personalized_content = {
             "difficulty_level": preferences.get("difficulty_level", "intermediate") if preferences else "intermediate",
-            "learning_path": ["basics", "sensors", "control", "advanced"],
+            "learning_path": _LEARNING_PATH,
             "next_chapter": "perception-action-loops",
             "estimated_progress": "35%",
-            "recommended_topics": ["sensor fusion", "deep RL", "kinematics"],
+            "recommended_topics": _RECOMMENDED_TOPICS,
         }
 
-        print(f"🤖 PERSONALIZATION (Mock ML/AI)")
-        print(f"   User: {user_email}")
-        print(f"   Tier: {user_tier}")
-        print(f"   Recommendations: {len(recommendations)}")
-        print(f"   Top 3: {recommendations[:3]}")
+        log.debug(
+            "personalization_generated",
+            user_email=user_email,
+            tier=user_tier,
+            recommendations=len(recommendations),
+            top_recommendations=recommendations[:3],
+        )
 
         return {
             "recommendations": recommendations,
@@ -108,19 +134,10 @@ class PersonalizeService:
 
         Production: Use spaCy, NLTK, or LLM for topic extraction.
         """
-        keywords = []
-        for msg in chat_history:
-            content = msg.get("content", "").lower()
-            # Simple keyword extraction (mock)
-            if "sensor" in content:
-                keywords.append("sensor")
-            if "perception" in content:
-                keywords.append("perception")
-            if "learning" in content or "train" in content:
-                keywords.append("learning")
-            if "control" in content:
-                keywords.append("control")
-        return list(set(keywords))
+        # Simple keyword extraction (mock); newline-joined so no keyword
+        # can match across two messages
+        text = "\n".join(msg.get("content", "") for msg in chat_history).lower()
+        return list({_KEYWORD_TOPICS[m] for m in _KEYWORD_RE.findall(text)})
 
 # Singleton instance
 personalize_service = PersonalizeService()
@@ -10,48 +10,60 @@ Provides:
 
 Usage:
     INTEGRATION_TEST_MODE=true python -m app.test_fixtures
+
+Each seed_test_* helper is a single INSERT ... ON CONFLICT statement (no
+existence SELECT); setup_integration_test_fixtures commits all three in one
+transaction.
 """
 
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from app.database import get_db, Base, engine
+from app import config
+from app.database import get_db, init_db
+from app.logger import log
 from app.models import User, Session as DBSession, VerificationToken
 from datetime import datetime, timedelta
-import secrets
 
 # Deterministic test data (DO NOT USE IN PRODUCTION)
 TEST_USER_EMAIL = "test@integration.local"
 TEST_USER_TIER = "lightweight"
 TEST_SESSION_TOKEN = "integration-test-session-token-12345"
 TEST_VERIFICATION_TOKEN = "integration-test-verification-token-67890"
+BULK_USER_EMAIL_TEMPLATE = "loadtest-{}@integration.local"
+
+
+def _insert(db: Session, model):
+    """Dialect-specific INSERT (supports ON CONFLICT) for the bound database."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql_insert(model)
+    return sqlite_insert(model)
 
 
 def seed_test_user(db: Session) -> User:
     """
     Create or get deterministic test user.
 
+    One INSERT ... ON CONFLICT (email) statement; an existing user is
+    returned unchanged.
+
     Returns:
         User: The test user
     """
-    # Check if test user already exists
-    user = db.query(User).filter(User.email == TEST_USER_EMAIL).first()
-
-    if user:
-        print(f"✅ Test user already exists: {TEST_USER_EMAIL}")
-        return user
-
-    # Create test user
-    user = User(
+    stmt = _insert(db, User).values(
         email=TEST_USER_EMAIL,
         email_verified=True,  # Pre-verified for testing
         tier=TEST_USER_TIER,
         created_at=datetime.utcnow(),
     )
-
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-
-    print(f"✅ Test user created: {TEST_USER_EMAIL} (ID: {user.id})")
+    # No-op update so RETURNING also yields the existing row
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.email],
+        set_={"email": stmt.excluded.email},
+    ).returning(User)
+    user = db.execute(stmt).scalar_one()
+
+    log.info("test_user_ready", email=TEST_USER_EMAIL, user_id=user.id)
     return user
 
 
@@ -59,36 +71,31 @@ def seed_test_session(db: Session, user: User) -> DBSession:
     """
     Create or get deterministic test session.
 
+    An existing session gets its expiry pushed out so it's not expired.
+
     Args:
         user: The test user
 
     Returns:
         DBSession: The test session
     """
-    # Check if test session already exists
-    session = db.query(DBSession).filter(DBSession.session_token == TEST_SESSION_TOKEN).first()
-
-    if session:
-        # Update expiry to ensure it's not expired
-        session.expires_at = datetime.utcnow() + timedelta(hours=24)
-        session.last_activity = datetime.utcnow()
-        db.commit()
-        print(f"✅ Test session already exists: {TEST_SESSION_TOKEN}")
-        return session
-
-    # Create test session
-    session = DBSession(
+    now = datetime.utcnow()
+    stmt = _insert(db, DBSession).values(
         user_id=user.id,
         session_token=TEST_SESSION_TOKEN,
-        expires_at=datetime.utcnow() + timedelta(hours=24),
-        last_activity=datetime.utcnow(),
+        expires_at=now + timedelta(hours=24),
+        last_activity=now,
     )
-
-    db.add(session)
-    db.commit()
-    db.refresh(session)
-
-    print(f"✅ Test session created: {TEST_SESSION_TOKEN} (User ID: {user.id})")
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DBSession.session_token],
+        set_={
+            "expires_at": stmt.excluded.expires_at,
+            "last_activity": stmt.excluded.last_activity,
+        },
+    ).returning(DBSession)
+    session = db.execute(stmt).scalar_one()
+
+    log.info("test_session_ready", user_id=session.user_id)
     return session
 
 
@@ -96,34 +103,53 @@ def seed_test_verification_token(db: Session) -> VerificationToken:
     """
     Create or get deterministic test verification token.
 
+    An existing token is reset to unused with a fresh expiry.
+
     Returns:
         VerificationToken: The test verification token
     """
-    # Check if test token already exists
-    token = db.query(VerificationToken).filter(VerificationToken.token == TEST_VERIFICATION_TOKEN).first()
-
-    if token:
-        # Update expiry to ensure it's not expired
-        token.expires_at = datetime.utcnow() + timedelta(minutes=10)
-        token.used = False
-        db.commit()
-        print(f"✅ Test verification token already exists: {TEST_VERIFICATION_TOKEN}")
-        return token
-
-    # Create test verification token
-    token = VerificationToken(
+    stmt = _insert(db, VerificationToken).values(
         email=TEST_USER_EMAIL,
         token=TEST_VERIFICATION_TOKEN,
         expires_at=datetime.utcnow() + timedelta(minutes=10),
         used=False,
     )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[VerificationToken.token],
+        set_={
+            "expires_at": stmt.excluded.expires_at,
+            "used": stmt.excluded.used,
+        },
+    ).returning(VerificationToken)
+    token = db.execute(stmt).scalar_one()
+
+    log.info("test_verification_ready", email=TEST_USER_EMAIL)
+    return token
 
-    db.add(token)
-    db.commit()
-    db.refresh(token)
 
-    print(f"✅ Test verification token created: {TEST_VERIFICATION_TOKEN}")
-    return token
+def seed_bulk_users(db: Session, count: int) -> int:
+    """
+    Create `count` deterministic load-test users in one executemany INSERT.
+
+    Existing users are skipped (ON CONFLICT DO NOTHING), so reruns are cheap.
+
+    Returns:
+        int: Number of users requested
+    """
+    now = datetime.utcnow()
+    rows = [
+        {
+            "email": BULK_USER_EMAIL_TEMPLATE.format(i),
+            "email_verified": True,
+            "tier": TEST_USER_TIER,
+            "created_at": now,
+        }
+        for i in range(count)
+    ]
+    db.execute(_insert(db, User).on_conflict_do_nothing(index_elements=[User.email]), rows)
+
+    log.info("load_test_users_ready", count=count)
+    return count
 
 
 def setup_integration_test_fixtures():
@@ -132,10 +158,12 @@ def setup_integration_test_fixtures():
 
     This should be called on backend startup in INTEGRATION_TEST_MODE.
     """
-    print("🧪 Setting up integration test fixtures...")
+    log.info("integration_fixtures_setup_started")
 
-    # Initialize database
-    Base.metadata.create_all(bind=engine)
+    # Initialize database (no-op if startup already did); DB_AUTO_CREATE=false
+    # means the schema is managed outside the app
+    if config.DB_AUTO_CREATE:
+        init_db()
 
     # Get database session
     db = next(get_db())
@@ -150,13 +178,17 @@ def setup_integration_test_fixtures():
         # Seed test verification token
         token = seed_test_verification_token(db)
 
-        print("✅ All integration test fixtures ready")
-        print(f"   Test User: {TEST_USER_EMAIL}")
-        print(f"   Test Session Token: {TEST_SESSION_TOKEN}")
-        print(f"   Test Verification Token: {TEST_VERIFICATION_TOKEN}")
+        # Optional load-test users (FIXTURE_BULK_SIZE)
+        if config.FIXTURE_BULK_SIZE > 0:
+            seed_bulk_users(db, config.FIXTURE_BULK_SIZE)
+
+        # One commit for all fixtures
+        db.commit()
+
+        log.info("integration_fixtures_ready", email=TEST_USER_EMAIL, tier=TEST_USER_TIER)
 
     except Exception as e:
-        print(f"❌ Failed to setup test fixtures: {e}")
+        log.error("integration_fixtures_setup_failed", error=str(e))
         db.rollback()
         raise
     finally: